@@ -5,10 +5,12 @@ Análise de risco baseada exclusivamente em dados de planilha
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
 import io
-from typing import List
+import functools
+import unicodedata
+from typing import List, Tuple
 from dataclasses import dataclass
 
 # ================================
@@ -33,6 +35,29 @@ SCORING_CONFIG = {
     "risco_alto": 100
 }
 
+# Pesos e limites resolvidos uma vez na importação (evita lookups no dict a cada cálculo)
+_PESO_TC = SCORING_CONFIG["peso_tempo_casa"]
+_PESO_PDI = SCORING_CONFIG["peso_pdi"]
+_PESO_TR = SCORING_CONFIG["peso_treinamentos"]
+_PESO_AU = SCORING_CONFIG["peso_ausencias"]
+_RISCO_BAIXO = SCORING_CONFIG["risco_baixo"]
+_RISCO_MEDIO = SCORING_CONFIG["risco_medio"]
+
+# Colunas obrigatórias da planilha (já normalizadas)
+REQUIRED_COLUMNS = ('nome', 'departamento', 'cargo', 'tempo_casa', 'participou_pdi', 'num_treinamentos', 'num_ausencias')
+
+# Cards de colaboradores exibidos por página no dashboard
+CARDS_POR_PAGINA = 20
+
+# Maior contagem (treinamentos/ausências) aceita na planilha
+CONTAGEM_MAXIMA = np.iinfo(np.int32).max
+
+# Dados de RH não vão para disco: caches só em memória e com poucas entradas
+CACHE_MAX_ENTRADAS = 4
+
+# Acima deste número de linhas o Excel fica lento; sugerimos Parquet
+EXCEL_MAX_LINHAS = 5000
+
 # Cores
 COLORS = {
     "primary": "#1f77b4",
@@ -42,11 +67,44 @@ COLORS = {
     "text": "#2c3e50"
 }
 
+# Fatores de risco (um bit por fator, na ordem de exibição)
+FATOR_MUITO_NOVO = 1 << 0
+FATOR_POUCO_TEMPO = 1 << 1
+FATOR_TEMPO_BAIXO = 1 << 2
+FATOR_VETERANO_SEM_PDI = 1 << 3
+FATOR_SEM_PDI = 1 << 4
+FATOR_PDI_PENDENTE = 1 << 5
+FATOR_ZERO_TREINAMENTOS = 1 << 6
+FATOR_POUCOS_TREINAMENTOS = 1 << 7
+FATOR_SEM_TREINAMENTOS = 1 << 8
+FATOR_AUSENCIAS_EXTREMAS = 1 << 9
+FATOR_AUSENCIAS_MUITO_FREQUENTES = 1 << 10
+FATOR_AUSENCIAS_FREQUENTES = 1 << 11
+FATOR_AUSENCIAS_PREOCUPANTES = 1 << 12
+FATOR_ALERTA_MAXIMO = 1 << 13
+
+FATORES_RISCO = (
+    (FATOR_MUITO_NOVO, "⚠️ Muito novo na empresa"),
+    (FATOR_POUCO_TEMPO, "⚠️ Pouco tempo de casa"),
+    (FATOR_TEMPO_BAIXO, "📝 Tempo de casa baixo"),
+    (FATOR_VETERANO_SEM_PDI, "🚨 CRÍTICO: Veterano sem PDI"),
+    (FATOR_SEM_PDI, "⚠️ Sem PDI nos últimos 12 meses"),
+    (FATOR_PDI_PENDENTE, "📝 PDI pendente"),
+    (FATOR_ZERO_TREINAMENTOS, "🚨 CRÍTICO: Zero treinamentos"),
+    (FATOR_POUCOS_TREINAMENTOS, "📚 Poucos treinamentos ({num_treinamentos})"),
+    (FATOR_SEM_TREINAMENTOS, "📚 Sem treinamentos"),
+    (FATOR_AUSENCIAS_EXTREMAS, "🚨 CRÍTICO: Ausências extremas ({num_ausencias})"),
+    (FATOR_AUSENCIAS_MUITO_FREQUENTES, "🚨 Ausências muito frequentes ({num_ausencias})"),
+    (FATOR_AUSENCIAS_FREQUENTES, "⚠️ Ausências frequentes ({num_ausencias})"),
+    (FATOR_AUSENCIAS_PREOCUPANTES, "⚠️ Ausências preocupantes ({num_ausencias})"),
+    (FATOR_ALERTA_MAXIMO, "🚨 ALERTA MÁXIMO: Múltiplos fatores críticos")
+)
+
 # ================================
 # CLASSE DE DADOS
 # ================================
 
-@dataclass
+@dataclass(slots=True)
 class Employee:
     nome: str
     departamento: str
@@ -56,8 +114,6 @@ class Employee:
     num_treinamentos: int
     num_ausencias: int
     score_risco: float = 0
-    fatores_risco: List[str] = None
-    acoes_recomendadas: List[str] = None
 
 # ================================
 # FUNÇÕES DE ANÁLISE
@@ -69,50 +125,50 @@ def calcular_score_risco(employee: Employee) -> float:
     
     # 1. Tempo de Casa (25%) - MAIS RIGOROSO
     if employee.tempo_casa < 0.5:  # < 6 meses
-        score += 30 * SCORING_CONFIG["peso_tempo_casa"]  # Era 15, agora 30
+        score += 30 * _PESO_TC  # Era 15, agora 30
     elif employee.tempo_casa < 1:  # 6-12 meses
-        score += 50 * SCORING_CONFIG["peso_tempo_casa"]  # Era 35, agora 50
+        score += 50 * _PESO_TC  # Era 35, agora 50
     elif employee.tempo_casa < 2:  # 1-2 anos
-        score += 20 * SCORING_CONFIG["peso_tempo_casa"]
+        score += 20 * _PESO_TC
     
     # 2. PDI (30%) - ULTRA RIGOROSO
     if not employee.participou_pdi:
         if employee.tempo_casa < 0.5:  # Novatos
-            score += 60 * SCORING_CONFIG["peso_pdi"]  # Era 15, agora 60
+            score += 60 * _PESO_PDI  # Era 15, agora 60
         elif employee.tempo_casa < 1:
-            score += 80 * SCORING_CONFIG["peso_pdi"]  # Era 50, agora 80
+            score += 80 * _PESO_PDI  # Era 50, agora 80
         elif employee.tempo_casa < 3:
-            score += 90 * SCORING_CONFIG["peso_pdi"]  # Era 75, agora 90
+            score += 90 * _PESO_PDI  # Era 75, agora 90
         else:  # Veteranos
-            score += 100 * SCORING_CONFIG["peso_pdi"]
+            score += 100 * _PESO_PDI
     
     # 3. Treinamentos (25%) - ULTRA RIGOROSO
     if employee.tempo_casa >= 0.5:  # Mudou de 1 ano para 6 meses
         if employee.num_treinamentos == 0:
-            score += 100 * SCORING_CONFIG["peso_treinamentos"]  # Máximo sempre
+            score += 100 * _PESO_TR  # Máximo sempre
         elif employee.num_treinamentos == 1:
-            score += 80 * SCORING_CONFIG["peso_treinamentos"]  # Era 75, agora 80
+            score += 80 * _PESO_TR  # Era 75, agora 80
         elif employee.num_treinamentos < 3:
-            score += 60 * SCORING_CONFIG["peso_treinamentos"]  # Era 50, agora 60
+            score += 60 * _PESO_TR  # Era 50, agora 60
         elif employee.num_treinamentos < 5:
-            score += 30 * SCORING_CONFIG["peso_treinamentos"]  # Era 25, agora 30
+            score += 30 * _PESO_TR  # Era 25, agora 30
     else:  # Muito novatos (< 6 meses)
         if employee.num_treinamentos == 0:
-            score += 70 * SCORING_CONFIG["peso_treinamentos"]  # Era 40, agora 70
+            score += 70 * _PESO_TR  # Era 40, agora 70
         elif employee.num_treinamentos < 2:
-            score += 40 * SCORING_CONFIG["peso_treinamentos"]  # Era 20, agora 40
+            score += 40 * _PESO_TR  # Era 20, agora 40
     
     # 4. Ausências (20%) - EXPONENCIAL
     if employee.num_ausencias <= 2:
-        score += 10 * SCORING_CONFIG["peso_ausencias"]  # Era 5, agora 10
+        score += 10 * _PESO_AU  # Era 5, agora 10
     elif employee.num_ausencias <= 5:
-        score += 40 * SCORING_CONFIG["peso_ausencias"]  # Era 30, agora 40
+        score += 40 * _PESO_AU  # Era 30, agora 40
     elif employee.num_ausencias <= 10:
-        score += 70 * SCORING_CONFIG["peso_ausencias"]  # Era 60, agora 70
+        score += 70 * _PESO_AU  # Era 60, agora 70
     elif employee.num_ausencias <= 20:
-        score += 90 * SCORING_CONFIG["peso_ausencias"]  # Era 85, agora 90
+        score += 90 * _PESO_AU  # Era 85, agora 90
     else:  # 20+ ausências
-        score += 100 * SCORING_CONFIG["peso_ausencias"]
+        score += 100 * _PESO_AU
         
         # Bônus MASSIVO para casos extremos
         if employee.num_ausencias >= 50:
@@ -136,150 +192,265 @@ def calcular_score_risco(employee: Employee) -> float:
     
     return min(score, 100)
 
-def identificar_fatores_risco(employee: Employee) -> List[str]:
-    """Identifica fatores de risco"""
-    fatores = []
+def calcular_score_risco_vetorizado(df: pd.DataFrame) -> np.ndarray:
+    """Mesmo cálculo de calcular_score_risco, aplicado a todas as linhas de uma vez"""
+    tempo = df['tempo_casa'].to_numpy(dtype=float)
+    sem_pdi = ~df['participou_pdi'].to_numpy(dtype=bool)
+    trein = df['num_treinamentos'].to_numpy()
+    aus = df['num_ausencias'].to_numpy()
+    
+    # 1. Tempo de Casa
+    score = np.select([tempo < 0.5, tempo < 1, tempo < 2], [30, 50, 20], 0) * _PESO_TC
+    
+    # 2. PDI
+    score = score + np.where(
+        sem_pdi, np.select([tempo < 0.5, tempo < 1, tempo < 3], [60, 80, 90], 100), 0
+    ) * _PESO_PDI
+    
+    # 3. Treinamentos
+    score = score + np.where(
+        tempo >= 0.5,
+        np.select([trein == 0, trein == 1, trein < 3, trein < 5], [100, 80, 60, 30], 0),
+        np.select([trein == 0, trein < 2], [70, 40], 0)
+    ) * _PESO_TR
+    
+    # 4. Ausências (+ bônus para casos extremos)
+    score = score + np.select([aus <= 2, aus <= 5, aus <= 10, aus <= 20], [10, 40, 70, 90], 100) * _PESO_AU
+    score = score + np.select([aus >= 50, aus >= 30], [25, 15], 0)
+    
+    # 5. Bônus combinação crítica
+    score = score + np.where((tempo >= 1) & sem_pdi & (trein <= 1) & (aus >= 20), 25, 0)
+    
+    # 6. Bônus para novatos problemáticos
+    score = score + np.where((tempo < 1) & sem_pdi & (trein == 0) & (aus >= 30), 20, 0)
+    
+    return np.minimum(score, 100)
+
+def calcular_flags_risco(employee: Employee) -> int:
+    """Máscara de bits com os fatores de risco do colaborador"""
+    flags = 0
     
     if employee.tempo_casa < 0.5:
-        fatores.append("⚠️ Muito novo na empresa")
+        flags |= FATOR_MUITO_NOVO
     elif employee.tempo_casa < 1:
-        fatores.append("⚠️ Pouco tempo de casa")
+        flags |= FATOR_POUCO_TEMPO
     elif employee.tempo_casa < 2:
-        fatores.append("📝 Tempo de casa baixo")
+        flags |= FATOR_TEMPO_BAIXO
     
     if not employee.participou_pdi:
         if employee.tempo_casa >= 3:
-            fatores.append("🚨 CRÍTICO: Veterano sem PDI")
+            flags |= FATOR_VETERANO_SEM_PDI
         elif employee.tempo_casa >= 1:
-            fatores.append("⚠️ Sem PDI nos últimos 12 meses")
+            flags |= FATOR_SEM_PDI
         else:
-            fatores.append("📝 PDI pendente")
+            flags |= FATOR_PDI_PENDENTE
     
     if employee.tempo_casa >= 1:
         if employee.num_treinamentos == 0:
-            fatores.append("🚨 CRÍTICO: Zero treinamentos")
+            flags |= FATOR_ZERO_TREINAMENTOS
         elif employee.num_treinamentos < 3:
-            fatores.append(f"📚 Poucos treinamentos ({employee.num_treinamentos})")
+            flags |= FATOR_POUCOS_TREINAMENTOS
     else:
         if employee.num_treinamentos == 0:
-            fatores.append("📚 Sem treinamentos")
+            flags |= FATOR_SEM_TREINAMENTOS
     
     if employee.num_ausencias >= 50:
-        fatores.append(f"🚨 CRÍTICO: Ausências extremas ({employee.num_ausencias})")
+        flags |= FATOR_AUSENCIAS_EXTREMAS
     elif employee.num_ausencias >= 20:
-        fatores.append(f"🚨 Ausências muito frequentes ({employee.num_ausencias})")
+        flags |= FATOR_AUSENCIAS_MUITO_FREQUENTES
     elif employee.num_ausencias > 10:
-        fatores.append(f"⚠️ Ausências frequentes ({employee.num_ausencias})")
+        flags |= FATOR_AUSENCIAS_FREQUENTES
     elif employee.num_ausencias > 5:
-        fatores.append(f"⚠️ Ausências preocupantes ({employee.num_ausencias})")
+        flags |= FATOR_AUSENCIAS_PREOCUPANTES
     
     if (employee.tempo_casa >= 2 and 
         not employee.participou_pdi and 
         employee.num_treinamentos <= 1 and 
         employee.num_ausencias >= 20):
-        fatores.append("🚨 ALERTA MÁXIMO: Múltiplos fatores críticos")
+        flags |= FATOR_ALERTA_MAXIMO
     
-    return fatores
+    return flags
 
-def gerar_recomendacoes(fatores_risco: List[str], employee: Employee) -> List[str]:
-    """Gera recomendações"""
+def calcular_flags_risco_vetorizado(df: pd.DataFrame) -> np.ndarray:
+    """Mesmas regras de calcular_flags_risco, aplicadas a todas as linhas de uma vez"""
+    tempo = df['tempo_casa'].to_numpy(dtype=float)
+    sem_pdi = ~df['participou_pdi'].to_numpy(dtype=bool)
+    trein = df['num_treinamentos'].to_numpy()
+    aus = df['num_ausencias'].to_numpy()
+    
+    flags = np.select(
+        [tempo < 0.5, tempo < 1, tempo < 2],
+        [FATOR_MUITO_NOVO, FATOR_POUCO_TEMPO, FATOR_TEMPO_BAIXO], 0
+    )
+    flags |= np.where(sem_pdi, np.select(
+        [tempo >= 3, tempo >= 1],
+        [FATOR_VETERANO_SEM_PDI, FATOR_SEM_PDI], FATOR_PDI_PENDENTE
+    ), 0)
+    flags |= np.where(
+        tempo >= 1,
+        np.select([trein == 0, trein < 3], [FATOR_ZERO_TREINAMENTOS, FATOR_POUCOS_TREINAMENTOS], 0),
+        np.where(trein == 0, FATOR_SEM_TREINAMENTOS, 0)
+    )
+    flags |= np.select(
+        [aus >= 50, aus >= 20, aus > 10, aus > 5],
+        [FATOR_AUSENCIAS_EXTREMAS, FATOR_AUSENCIAS_MUITO_FREQUENTES,
+         FATOR_AUSENCIAS_FREQUENTES, FATOR_AUSENCIAS_PREOCUPANTES], 0
+    )
+    flags |= np.where((tempo >= 2) & sem_pdi & (trein <= 1) & (aus >= 20), FATOR_ALERTA_MAXIMO, 0)
+    
+    return flags.astype(np.uint32)
+
+def descrever_fatores(flags: int, num_treinamentos: int, num_ausencias: int) -> List[str]:
+    """Traduz a máscara de fatores para as mensagens exibidas"""
+    return [
+        mensagem.format(num_treinamentos=num_treinamentos, num_ausencias=num_ausencias)
+        for fator, mensagem in FATORES_RISCO if flags & fator
+    ]
+
+def identificar_fatores_risco(employee: Employee) -> List[str]:
+    """Identifica fatores de risco"""
+    return descrever_fatores(calcular_flags_risco(employee), employee.num_treinamentos, employee.num_ausencias)
+
+@functools.lru_cache(maxsize=4096)
+def gerar_recomendacoes(flags_risco: int) -> Tuple[str, ...]:
+    """Gera recomendações (uma tupla compartilhada por combinação de fatores)"""
     recomendacoes = []
     
-    if "CRÍTICO" in str(fatores_risco):
+    if flags_risco & (FATOR_VETERANO_SEM_PDI | FATOR_ZERO_TREINAMENTOS | FATOR_AUSENCIAS_EXTREMAS):
         recomendacoes.append("🚨 URGENTE: Reunião imediata com RH")
         recomendacoes.append("📋 Plano de ação em 48h")
     
-    if any("novo" in f or "Pouco tempo" in f for f in fatores_risco):
+    if flags_risco & (FATOR_MUITO_NOVO | FATOR_POUCO_TEMPO):
         recomendacoes.append("👥 Programa de mentoria")
     
-    if "Veterano sem PDI" in str(fatores_risco):
+    if flags_risco & FATOR_VETERANO_SEM_PDI:
         recomendacoes.append("📋 PDI emergencial (7 dias)")
-    elif "Sem PDI" in str(fatores_risco):
+    elif flags_risco & FATOR_SEM_PDI:
         recomendacoes.append("📋 Agendar PDI (15 dias)")
     
-    if "Zero treinamentos" in str(fatores_risco):
+    if flags_risco & FATOR_ZERO_TREINAMENTOS:
         recomendacoes.append("🎓 Trilha de desenvolvimento urgente")
-    elif "Poucos treinamentos" in str(fatores_risco):
+    elif flags_risco & FATOR_POUCOS_TREINAMENTOS:
         recomendacoes.append("📖 Ampliar capacitação")
     
-    if "extremas" in str(fatores_risco):
+    if flags_risco & FATOR_AUSENCIAS_EXTREMAS:
         recomendacoes.append("🏥 Avaliação médica")
-    elif "muito frequentes" in str(fatores_risco):
+    elif flags_risco & FATOR_AUSENCIAS_MUITO_FREQUENTES:
         recomendacoes.append("💬 Investigar causas das ausências")
     
-    if "ALERTA MÁXIMO" in str(fatores_risco):
+    if flags_risco & FATOR_ALERTA_MAXIMO:
         recomendacoes.append("🚨 COMITÊ DE RETENÇÃO")
     
     if not recomendacoes:
         recomendacoes.append("✅ Acompanhamento regular")
     
-    return recomendacoes
+    return tuple(recomendacoes)
 
 def get_risk_level(score: float) -> str:
     """Níveis de risco"""
-    if score <= SCORING_CONFIG["risco_baixo"]:
+    if score <= _RISCO_BAIXO:
         return "Baixo"
-    elif score <= SCORING_CONFIG["risco_medio"]:
+    elif score <= _RISCO_MEDIO:
         return "Médio"
     else:
         return "Alto"
 
-def get_risk_color(score: float) -> str:
-    """Cores por nível"""
-    if score <= SCORING_CONFIG["risco_baixo"]:
-        return COLORS["success"]
-    elif score <= SCORING_CONFIG["risco_medio"]:
-        return COLORS["secondary"]
-    else:
-        return COLORS["warning"]
+def get_risk_colors(niveis: pd.Series) -> np.ndarray:
+    """Cores por nível para uma série de níveis de risco"""
+    return np.asarray(niveis.map({
+        "Baixo": COLORS["success"],
+        "Médio": COLORS["secondary"],
+        "Alto": COLORS["warning"]
+    }), dtype=object)
 
 # ================================
 # PROCESSAMENTO DE DADOS
 # ================================
 
-def processar_planilha(df: pd.DataFrame) -> List[Employee]:
-    """Processa planilha Excel"""
-    employees = []
-    
-    df.columns = df.columns.str.lower().str.strip().str.replace(' ', '_')
-    
-    required_columns = ['nome', 'departamento', 'cargo', 'tempo_casa', 'participou_pdi', 'num_treinamentos', 'num_ausencias']
+def normalizar_nome(nome: str) -> str:
+    """Chave do nome sem acentos, minúscula e sem espaços"""
+    sem_acento = unicodedata.normalize('NFKD', str(nome)).encode('ascii', 'ignore').decode('ascii')
+    return '_'.join(sem_acento.lower().split())
+
+def normalizar_colunas(colunas: pd.Index) -> pd.Index:
+    """Nomes de coluna minúsculos, sem espaços nas pontas e com '_' no lugar de espaços"""
+    return colunas.astype(str).str.lower().str.strip().str.replace(' ', '_', regex=False)
+
+def _coluna_obrigatoria(coluna) -> bool:
+    return normalizar_colunas(pd.Index([coluna]))[0] in REQUIRED_COLUMNS
+
+def processar_planilha(df: pd.DataFrame) -> pd.DataFrame:
+    """Processa planilha Excel (uma linha por colaborador, vazia em caso de erro)"""
+    df.columns = normalizar_colunas(df.columns)
     
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    colunas = frozenset(df.columns)
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in colunas]
     if missing_columns:
         st.error(f"❌ Colunas ausentes: {', '.join(missing_columns)}")
-        return employees
-    
-    for _, row in df.iterrows():
-        try:
-            employee = Employee(
-                nome=str(row['nome']).strip(),
-                departamento=str(row['departamento']).strip(),
-                cargo=str(row['cargo']).strip(),
-                tempo_casa=float(row['tempo_casa']),
-                participou_pdi=str(row['participou_pdi']).lower() in ['sim', 'yes', 'true', '1'],
-                num_treinamentos=int(row['num_treinamentos']),
-                num_ausencias=int(row['num_ausencias'])
-            )
-            
-            employee.score_risco = calcular_score_risco(employee)
-            employee.fatores_risco = identificar_fatores_risco(employee)
-            employee.acoes_recomendadas = gerar_recomendacoes(employee.fatores_risco, employee)
-            
-            employees.append(employee)
-            
-        except Exception as e:
-            st.warning(f"⚠️ Erro ao processar {row.get('nome', 'N/A')}: {str(e)}")
-    
-    return employees
+        return pd.DataFrame()
+    
+    df = df[list(REQUIRED_COLUMNS)].copy()
+    df['tempo_casa'] = pd.to_numeric(df['tempo_casa'], errors='coerce')
+    df['num_treinamentos'] = pd.to_numeric(df['num_treinamentos'], errors='coerce')
+    df['num_ausencias'] = pd.to_numeric(df['num_ausencias'], errors='coerce')
+    
+    # Vazios, texto, inf e contagens fora da faixa de int32 invalidam a linha
+    contagens = df[['num_treinamentos', 'num_ausencias']]
+    invalidos = ~(
+        np.isfinite(df[['tempo_casa', 'num_treinamentos', 'num_ausencias']]).all(axis=1)
+        & (contagens.abs() <= CONTAGEM_MAXIMA).all(axis=1)
+    )
+    for nome in df.loc[invalidos, 'nome']:
+        st.warning(f"⚠️ Erro ao processar {nome}: valores numéricos inválidos")
+    df = df.loc[~invalidos].copy()
+    
+    for col in ('nome', 'departamento', 'cargo'):
+        df[col] = df[col].map(str).str.strip()
+    df['participou_pdi'] = df['participou_pdi'].astype(str).str.lower().isin(['sim', 'yes', 'true', '1'])
+    df['num_treinamentos'] = df['num_treinamentos'].astype(int)
+    df['num_ausencias'] = df['num_ausencias'].astype(int)
+    
+    scores = calcular_score_risco_vetorizado(df)
+    flags = calcular_flags_risco_vetorizado(df)
+    
+    trein = df['num_treinamentos'].tolist()
+    aus = df['num_ausencias'].tolist()
+    
+    return pd.DataFrame({
+        'nome': df['nome'].to_numpy(),
+        'nome_key': [normalizar_nome(nome) for nome in df['nome']],
+        'departamento': pd.Categorical(df['departamento']),
+        'cargo': df['cargo'].to_numpy(),
+        'tempo_casa': df['tempo_casa'].to_numpy(dtype=float),
+        'participou_pdi': df['participou_pdi'].to_numpy(),
+        'num_treinamentos': _menor_inteiro(df['num_treinamentos'].to_numpy()),
+        'num_ausencias': _menor_inteiro(df['num_ausencias'].to_numpy()),
+        # Nível calculado em float64; o score fica em float32 (exibido com 1 casa decimal)
+        'score_risco': scores.astype(np.float32),
+        'nivel_risco': classificar_risco(scores),
+        'flags_risco': flags,
+        'fatores_risco': ['; '.join(descrever_fatores(f, t, a)) for f, t, a in zip(flags.tolist(), trein, aus)],
+        'acoes_recomendadas': ['; '.join(gerar_recomendacoes(f)) for f in flags.tolist()]
+    }, copy=False)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRADAS)
+def ler_planilha(file_bytes: bytes) -> pd.DataFrame:
+    """Lê a planilha (apenas colunas obrigatórias); o resultado fica em cache pelo conteúdo do arquivo"""
+    return pd.read_excel(io.BytesIO(file_bytes), engine='calamine', usecols=_coluna_obrigatoria)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRADAS)
+def analisar_planilha(file_bytes: bytes) -> pd.DataFrame:
+    """Lê e processa a planilha; o resultado fica em cache pelo conteúdo do arquivo"""
+    return processar_planilha(ler_planilha(file_bytes))
 
 # ================================
 # VISUALIZAÇÕES
 # ================================
 
-def apply_custom_css():
-    """CSS customizado"""
-    st.markdown(f"""
+@st.cache_resource
+def _css_block() -> str:
+    """CSS customizado (depende apenas de COLORS, montado uma vez por processo)"""
+    return f"""
     <style>
         .custom-header {{
             background: linear-gradient(135deg, {COLORS['primary']} 0%, {COLORS['secondary']} 100%);
@@ -303,7 +474,11 @@ def apply_custom_css():
         .risk-medium {{ border-left-color: {COLORS['secondary']}; }}
         .risk-low {{ border-left-color: {COLORS['success']}; }}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def apply_custom_css():
+    """CSS customizado"""
+    st.markdown(_css_block(), unsafe_allow_html=True)
 
 def create_metric_card(title: str, value: str, risk_level: str = "low"):
     """Card de métrica"""
@@ -315,17 +490,15 @@ def create_metric_card(title: str, value: str, risk_level: str = "low"):
     </div>
     """
 
-def create_risk_chart(employees: List[Employee]):
+def create_risk_chart(emp_df: pd.DataFrame):
     """Gráfico de distribuição"""
-    risk_counts = {"Baixo": 0, "Médio": 0, "Alto": 0}
+    import plotly.graph_objects as go
     
-    for emp in employees:
-        level = get_risk_level(emp.score_risco)
-        risk_counts[level] += 1
+    risk_counts = emp_df['nivel_risco'].value_counts().reindex(["Baixo", "Médio", "Alto"], fill_value=0)
     
     fig = go.Figure(data=[go.Pie(
-        labels=list(risk_counts.keys()),
-        values=list(risk_counts.values()),
+        labels=["Baixo", "Médio", "Alto"],
+        values=risk_counts.tolist(),
         hole=.3,
         marker_colors=[COLORS["success"], COLORS["secondary"], COLORS["warning"]]
     )])
@@ -338,39 +511,115 @@ def create_risk_chart(employees: List[Employee]):
     
     return fig
 
-def export_to_excel(employees: List[Employee]) -> bytes:
-    """Exporta para Excel"""
-    data = []
-    for emp in employees:
-        data.append({
-            'Nome': emp.nome,
-            'Departamento': emp.departamento,
-            'Cargo': emp.cargo,
-            'Tempo_Casa_Anos': emp.tempo_casa,
-            'Participou_PDI': 'Sim' if emp.participou_pdi else 'Não',
-            'Num_Treinamentos': emp.num_treinamentos,
-            'Num_Ausencias': emp.num_ausencias,
-            'Score_Risco': round(emp.score_risco, 1),
-            'Nivel_Risco': get_risk_level(emp.score_risco),
-            'Fatores_Risco': '; '.join(emp.fatores_risco) if emp.fatores_risco else '',
-            'Acoes_Recomendadas': '; '.join(emp.acoes_recomendadas) if emp.acoes_recomendadas else ''
-        })
-    
-    df = pd.DataFrame(data)
+def create_gauge_chart(score: float, color: str):
+    """Gauge do score individual"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = score,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Score de Risco"},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': color},
+            'steps': [
+                {'range': [0, 20], 'color': "lightgreen"},
+                {'range': [20, 45], 'color': "lightyellow"},
+                {'range': [45, 100], 'color': "lightcoral"}
+            ]
+        }
+    ))
+    fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
+    
+    return fig
+
+def classificar_risco(scores: np.ndarray) -> pd.Categorical:
+    """Nível de risco de cada score (mesmas faixas de get_risk_level)"""
+    # Faixas fechadas à direita: score == limite fica na faixa de baixo
+    faixas = np.searchsorted(np.array([_RISCO_BAIXO, _RISCO_MEDIO], dtype=float), scores, side='left')
+    return pd.Categorical.from_codes(faixas, categories=["Baixo", "Médio", "Alto"], ordered=True)
+
+def _menor_inteiro(valores: np.ndarray) -> np.ndarray:
+    """Converte contagens para o menor tipo inteiro que comporte os valores"""
+    return pd.to_numeric(valores, downcast='integer')
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRADAS)
+def formatar_relatorio(emp_df: pd.DataFrame) -> pd.DataFrame:
+    """Colunas no formato do relatório exportado (em cache enquanto os dados não mudam)"""
+    return pd.DataFrame({
+        'Nome': emp_df['nome'],
+        'Departamento': emp_df['departamento'],
+        'Cargo': emp_df['cargo'],
+        'Tempo_Casa_Anos': emp_df['tempo_casa'],
+        'Participou_PDI': emp_df['participou_pdi'].map({True: 'Sim', False: 'Não'}),
+        'Num_Treinamentos': emp_df['num_treinamentos'],
+        'Num_Ausencias': emp_df['num_ausencias'],
+        'Score_Risco': emp_df['score_risco'].astype(float).round(1),
+        'Nivel_Risco': emp_df['nivel_risco'],
+        'Fatores_Risco': emp_df['fatores_risco'],
+        'Acoes_Recomendadas': emp_df['acoes_recomendadas']
+    })
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRADAS)
+def export_to_excel(emp_df: pd.DataFrame) -> bytes:
+    """Exporta para Excel (em cache enquanto os dados não mudam)"""
+    import xlsxwriter
+    
+    df = formatar_relatorio(emp_df)
     
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Analise_Risco', index=False)
+    # Sem arquivos temporários em disco (dados de RH); a planilha inteira fica em memória
+    workbook = xlsxwriter.Workbook(output, {'in_memory': True, 'strings_to_urls': False})
+    worksheet = workbook.add_worksheet('Analise_Risco')
+    worksheet.write_row(0, 0, df.columns)
+    for linha, valores in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(linha, 0, valores)
+    workbook.close()
     
     return output.getvalue()
 
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRADAS)
+def export_to_parquet(emp_df: pd.DataFrame) -> bytes:
+    """Exporta para Parquet (mais rápido e compacto para bases grandes)"""
+    output = io.BytesIO()
+    formatar_relatorio(emp_df).to_parquet(output, index=False, compression='zstd')
+    return output.getvalue()
+
+@st.cache_resource
+def modelo_excel() -> bytes:
+    """Planilha modelo para download (conteúdo fixo, montada uma vez por processo)"""
+    modelo_data = {
+        'nome': ['João Silva', 'Maria Santos', 'Pedro Lima'],
+        'departamento': ['Vendas', 'Marketing', 'TI'],
+        'cargo': ['Vendedor', 'Analista', 'Desenvolvedor'],
+        'tempo_casa': [0.3, 2.5, 7.0],
+        'participou_pdi': ['Não', 'Sim', 'Não'],
+        'num_treinamentos': [0, 4, 0],
+        'num_ausencias': [8, 2, 50]
+    }
+    
+    output = io.BytesIO()
+    pd.DataFrame(modelo_data).to_excel(output, index=False, engine='xlsxwriter')
+    return output.getvalue()
+
 # ================================
 # INTERFACE
 # ================================
 
 def init_session_state():
-    if 'employees' not in st.session_state:
-        st.session_state.employees = []
+    if 'emp_df' not in st.session_state:
+        st.session_state.emp_df = pd.DataFrame()
+    if 'stats' not in st.session_state:
+        st.session_state.stats = {'total': 0, 'high_risk': 0}
+
+def atualizar_sessao(emp_df: pd.DataFrame):
+    """Guarda a tabela de colaboradores analisados e os dados derivados dela"""
+    st.session_state.emp_df = emp_df
+    st.session_state.stats = {
+        'total': len(emp_df),
+        'high_risk': int((emp_df['nivel_risco'] == "Alto").sum())
+    }
 
 def main():
     apply_custom_css()
@@ -393,14 +642,30 @@ def main():
             ["🏠 Início", "📤 Upload Excel", "📊 Dashboard", "📋 Exportar"]
         )
         
-        if st.session_state.employees:
+        if st.session_state.stats['total']:
             st.markdown("### 📈 Stats")
-            total = len(st.session_state.employees)
-            high_risk = len([e for e in st.session_state.employees if e.score_risco > 45])
-            st.metric("Total", total)
-            st.metric("Alto Risco", high_risk)
+            st.metric("Total", st.session_state.stats['total'])
+            st.metric("Alto Risco", st.session_state.stats['high_risk'])
+    
+    # Páginas (?profile=1 na URL ativa o streamlit-profiler)
+    profiler = None
+    if st.query_params.get("profile") == "1":
+        try:
+            from streamlit_profiler import Profiler
+            profiler = Profiler()
+        except ImportError:
+            st.warning("⚠️ streamlit-profiler não está instalado; exibindo a página sem perfilamento")
     
-    # Páginas
+    if profiler is None:
+        render_page(page)
+    else:
+        profiler.start()
+        try:
+            render_page(page)
+        finally:
+            profiler.stop()
+
+def render_page(page: str):
     if page == "🏠 Início":
         render_home()
     elif page == "📤 Upload Excel":
@@ -431,27 +696,13 @@ def render_home():
         """)
     
     with col2:
-        if st.button("📥 Baixar Modelo Excel", use_container_width=True):
-            modelo_data = {
-                'nome': ['João Silva', 'Maria Santos', 'Pedro Lima'],
-                'departamento': ['Vendas', 'Marketing', 'TI'],
-                'cargo': ['Vendedor', 'Analista', 'Desenvolvedor'],
-                'tempo_casa': [0.3, 2.5, 7.0],
-                'participou_pdi': ['Não', 'Sim', 'Não'],
-                'num_treinamentos': [0, 4, 0],
-                'num_ausencias': [8, 2, 50]
-            }
-            
-            df_modelo = pd.DataFrame(modelo_data)
-            output = io.BytesIO()
-            df_modelo.to_excel(output, index=False, engine='openpyxl')
-            
-            st.download_button(
-                "💾 Download Modelo",
-                data=output.getvalue(),
-                file_name="modelo_radar_rh.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+        st.download_button(
+            "📥 Baixar Modelo Excel",
+            data=modelo_excel(),
+            file_name="modelo_radar_rh.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True
+        )
 
 def render_upload():
     st.markdown("### 📤 Upload da Planilha Excel")
@@ -474,21 +725,19 @@ def render_upload():
     
     if uploaded_file:
         try:
-            df = pd.read_excel(uploaded_file)
+            df = ler_planilha(uploaded_file.getvalue())
             st.success(f"✅ Arquivo carregado: {len(df)} registros")
             
             st.dataframe(df.head(), use_container_width=True)
             
             if st.button("🚀 Processar Análise", use_container_width=True):
                 with st.spinner("Analisando dados..."):
-                    employees = processar_planilha(df)
+                    emp_df = analisar_planilha(uploaded_file.getvalue())
                     
-                    if employees:
-                        st.session_state.employees = employees
-                        st.success(f"✅ {len(employees)} colaboradores analisados!")
-                        
-                        high_risk = len([e for e in employees if e.score_risco > 45])
-                        st.warning(f"🚨 {high_risk} colaboradores em ALTO RISCO")
+                    if not emp_df.empty:
+                        atualizar_sessao(emp_df)
+                        st.success(f"✅ {len(emp_df)} colaboradores analisados!")
+                        st.warning(f"🚨 {st.session_state.stats['high_risk']} colaboradores em ALTO RISCO")
                         st.balloons()
                     else:
                         st.error("❌ Erro no processamento")
@@ -497,21 +746,19 @@ def render_upload():
             st.error(f"❌ Erro: {str(e)}")
 
 def render_dashboard():
-    if not st.session_state.employees:
+    if st.session_state.emp_df.empty:
         st.warning("⚠️ Carregue dados primeiro")
         return
     
     st.markdown("### 📊 Dashboard de Risco")
     
-    employees = st.session_state.employees
+    emp_df = st.session_state.emp_df
     
     # Métricas
     col1, col2, col3, col4 = st.columns(4)
     
-    total = len(employees)
-    high_risk = len([e for e in employees if e.score_risco > 45])
-    medium_risk = len([e for e in employees if 20 < e.score_risco <= 45])
-    low_risk = len([e for e in employees if e.score_risco <= 20])
+    total = len(emp_df)
+    low_risk, medium_risk, high_risk = np.bincount(emp_df['nivel_risco'].cat.codes, minlength=3).tolist()
     
     with col1:
         st.markdown(create_metric_card("Total", str(total)), unsafe_allow_html=True)
@@ -523,104 +770,103 @@ def render_dashboard():
         st.markdown(create_metric_card("Baixo Risco", f"{low_risk} ({(low_risk/total)*100:.1f}%)", "low"), unsafe_allow_html=True)
     
     # Gráfico
-    fig = create_risk_chart(employees)
+    fig = create_risk_chart(emp_df)
     st.plotly_chart(fig, use_container_width=True)
     
     # Lista COMPLETA de colaboradores com análise individual
     st.markdown("### 👥 Análise Individual dos Colaboradores")
     
-    for i, emp in enumerate(employees):
-        risk_level = get_risk_level(emp.score_risco)
-        risk_color = get_risk_color(emp.score_risco)
+    total_paginas = -(-total // CARDS_POR_PAGINA)
+    pagina = 1
+    if total_paginas > 1:
+        pagina = st.number_input(f"Página (de {total_paginas})", min_value=1, max_value=total_paginas, value=1, step=1)
+    
+    inicio = (pagina - 1) * CARDS_POR_PAGINA
+    pagina_df = emp_df.iloc[inicio:inicio + CARDS_POR_PAGINA]
+    risk_colors = get_risk_colors(pagina_df['nivel_risco'])
+    
+    for i, (emp, risk_color) in enumerate(zip(pagina_df.itertuples(index=False), risk_colors), start=inicio):
+        render_employee_card(emp, i, emp.nivel_risco, risk_color)
+
+@st.fragment
+def render_employee_card(emp, i: int, risk_level: str, risk_color: str):
+    """Card individual (emp é uma linha de emp_df); o botão de análise detalhada reroda só este fragmento"""
+    fatores_risco = descrever_fatores(emp.flags_risco, emp.num_treinamentos, emp.num_ausencias)
+    acoes_recomendadas = gerar_recomendacoes(emp.flags_risco)
+
+    # Expandir para cada colaborador
+    with st.expander(f"{emp.nome} - {emp.departamento} | Score: {emp.score_risco:.1f} ({risk_level})", expanded=False):
+        
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.markdown("#### 📊 Dados Básicos")
+            st.write(f"**Cargo:** {emp.cargo}")
+            st.write(f"**Tempo de Casa:** {emp.tempo_casa} anos")
+            st.write(f"**PDI:** {'✅ Sim' if emp.participou_pdi else '❌ Não'}")
+            st.write(f"**Treinamentos:** {emp.num_treinamentos}")
+            st.write(f"**Ausências:** {emp.num_ausencias}")
+            
+            # Gauge do score
+            fig_gauge = create_gauge_chart(emp.score_risco, risk_color)
+            st.plotly_chart(fig_gauge, use_container_width=True, key=f"gauge_{i}_{emp.nome_key}")
         
-        # Expandir para cada colaborador
-        with st.expander(f"{emp.nome} - {emp.departamento} | Score: {emp.score_risco:.1f} ({risk_level})", expanded=False):
+        with col2:
+            st.markdown("#### 🚨 Fatores de Risco Identificados")
+            if fatores_risco:
+                for j, fator in enumerate(fatores_risco, 1):
+                    st.markdown(f"**{j}.** {fator}")
+            else:
+                st.success("✅ Nenhum fator de risco crítico identificado")
             
-            col1, col2 = st.columns([1, 2])
+            st.markdown("#### 💡 Recomendações de Ação")
+            if acoes_recomendadas:
+                for j, acao in enumerate(acoes_recomendadas, 1):
+                    st.markdown(f"**{j}.** {acao}")
             
-            with col1:
-                st.markdown("#### 📊 Dados Básicos")
-                st.write(f"**Cargo:** {emp.cargo}")
-                st.write(f"**Tempo de Casa:** {emp.tempo_casa} anos")
-                st.write(f"**PDI:** {'✅ Sim' if emp.participou_pdi else '❌ Não'}")
-                st.write(f"**Treinamentos:** {emp.num_treinamentos}")
-                st.write(f"**Ausências:** {emp.num_ausencias}")
+            # BOTÃO DE ANÁLISE DETALHADA
+            if st.button(f"🔍 Análise Detalhada", key=f"analise_detalhada_{i}_{emp.nome_key}", use_container_width=True):
+                st.markdown("#### 🔬 Breakdown Detalhado do Score")
                 
-                # Gauge do score
-                fig_gauge = go.Figure(go.Indicator(
-                    mode = "gauge+number",
-                    value = emp.score_risco,
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': "Score de Risco"},
-                    gauge = {
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': risk_color},
-                        'steps': [
-                            {'range': [0, 20], 'color': "lightgreen"},
-                            {'range': [20, 45], 'color': "lightyellow"},
-                            {'range': [45, 100], 'color': "lightcoral"}
-                        ]
-                    }
-                ))
-                fig_gauge.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
-                st.plotly_chart(fig_gauge, use_container_width=True, key=f"gauge_{i}_{emp.nome.replace(' ', '_')}")
-            
-            with col2:
-                st.markdown("#### 🚨 Fatores de Risco Identificados")
-                if emp.fatores_risco:
-                    for j, fator in enumerate(emp.fatores_risco, 1):
-                        st.markdown(f"**{j}.** {fator}")
-                else:
-                    st.success("✅ Nenhum fator de risco crítico identificado")
+                # Calcular cada componente
+                breakdown = calcular_breakdown_score(emp)
                 
-                st.markdown("#### 💡 Recomendações de Ação")
-                if emp.acoes_recomendadas:
-                    for j, acao in enumerate(emp.acoes_recomendadas, 1):
-                        st.markdown(f"**{j}.** {acao}")
+                st.markdown(f"""
+                **📊 Decomposição do Score ({emp.score_risco:.1f} pontos):**
                 
-                # BOTÃO DE ANÁLISE DETALHADA
-                if st.button(f"🔍 Análise Detalhada", key=f"analise_detalhada_{i}_{emp.nome.replace(' ', '_')}", use_container_width=True):
-                    st.markdown("#### 🔬 Breakdown Detalhado do Score")
-                    
-                    # Calcular cada componente
-                    breakdown = calcular_breakdown_score(emp)
-                    
-                    st.markdown(f"""
-                    **📊 Decomposição do Score ({emp.score_risco:.1f} pontos):**
-                    
-                    **1. ⏰ Tempo de Casa ({breakdown['tempo_casa']:.1f} pts):**
-                    - {emp.tempo_casa} anos na empresa
-                    - {breakdown['tempo_casa_desc']}
-                    
-                    **2. 📋 PDI ({breakdown['pdi']:.1f} pts):**
-                    - {'Participou' if emp.participou_pdi else 'NÃO participou'} nos últimos 12 meses
-                    - {breakdown['pdi_desc']}
-                    
-                    **3. 🎓 Treinamentos ({breakdown['treinamentos']:.1f} pts):**
-                    - {emp.num_treinamentos} treinamentos realizados
-                    - {breakdown['treinamentos_desc']}
-                    
-                    **4. 📅 Ausências ({breakdown['ausencias']:.1f} pts):**
-                    - {emp.num_ausencias} faltas nos últimos 6 meses
-                    - {breakdown['ausencias_desc']}
-                    
-                    **5. ⚡ Bônus/Penalizações ({breakdown['bonus']:.1f} pts):**
-                    - {breakdown['bonus_desc']}
-                    
-                    ---
-                    **🎯 TOTAL: {emp.score_risco:.1f} pontos = {risk_level.upper()} RISCO**
-                    """)
-                    
-                    # Recomendação urgente
-                    if emp.score_risco > 70:
-                        st.error("🚨 **AÇÃO URGENTE NECESSÁRIA!** Este colaborador apresenta risco crítico de saída.")
-                    elif emp.score_risco > 45:
-                        st.warning("⚠️ **ATENÇÃO NECESSÁRIA!** Monitorar de perto e implementar ações preventivas.")
-                    else:
-                        st.success("✅ **Situação controlada.** Manter acompanhamento regular.")
+                **1. ⏰ Tempo de Casa ({breakdown['tempo_casa']:.1f} pts):**
+                - {emp.tempo_casa} anos na empresa
+                - {breakdown['tempo_casa_desc']}
+                
+                **2. 📋 PDI ({breakdown['pdi']:.1f} pts):**
+                - {'Participou' if emp.participou_pdi else 'NÃO participou'} nos últimos 12 meses
+                - {breakdown['pdi_desc']}
+                
+                **3. 🎓 Treinamentos ({breakdown['treinamentos']:.1f} pts):**
+                - {emp.num_treinamentos} treinamentos realizados
+                - {breakdown['treinamentos_desc']}
+                
+                **4. 📅 Ausências ({breakdown['ausencias']:.1f} pts):**
+                - {emp.num_ausencias} faltas nos últimos 6 meses
+                - {breakdown['ausencias_desc']}
+                
+                **5. ⚡ Bônus/Penalizações ({breakdown['bonus']:.1f} pts):**
+                - {breakdown['bonus_desc']}
+                
+                ---
+                **🎯 TOTAL: {emp.score_risco:.1f} pontos = {risk_level.upper()} RISCO**
+                """)
+                
+                # Recomendação urgente
+                if emp.score_risco > 70:
+                    st.error("🚨 **AÇÃO URGENTE NECESSÁRIA!** Este colaborador apresenta risco crítico de saída.")
+                elif emp.score_risco > 45:
+                    st.warning("⚠️ **ATENÇÃO NECESSÁRIA!** Monitorar de perto e implementar ações preventivas.")
+                else:
+                    st.success("✅ **Situação controlada.** Manter acompanhamento regular.")
 
-def calcular_breakdown_score(employee: Employee) -> dict:
-    """Calcula breakdown detalhado do score para exibição"""
+def calcular_breakdown_score(employee) -> dict:
+    """Calcula breakdown detalhado do score para exibição (Employee ou linha de emp_df)"""
     breakdown = {
         'tempo_casa': 0,
         'pdi': 0,
@@ -636,13 +882,13 @@ def calcular_breakdown_score(employee: Employee) -> dict:
     
     # Tempo de Casa
     if employee.tempo_casa < 0.5:
-        breakdown['tempo_casa'] = 30 * SCORING_CONFIG["peso_tempo_casa"]
+        breakdown['tempo_casa'] = 30 * _PESO_TC
         breakdown['tempo_casa_desc'] = "Muito novo (< 6 meses) - Risco alto de não adaptação"
     elif employee.tempo_casa < 1:
-        breakdown['tempo_casa'] = 50 * SCORING_CONFIG["peso_tempo_casa"]
+        breakdown['tempo_casa'] = 50 * _PESO_TC
         breakdown['tempo_casa_desc'] = "Pouco tempo (< 1 ano) - Risco de saída precoce"
     elif employee.tempo_casa < 2:
-        breakdown['tempo_casa'] = 20 * SCORING_CONFIG["peso_tempo_casa"]
+        breakdown['tempo_casa'] = 20 * _PESO_TC
         breakdown['tempo_casa_desc'] = "Tempo baixo (< 2 anos) - Ainda em consolidação"
     else:
         breakdown['tempo_casa_desc'] = "Veterano - Estabilidade esperada"
@@ -650,16 +896,16 @@ def calcular_breakdown_score(employee: Employee) -> dict:
     # PDI
     if not employee.participou_pdi:
         if employee.tempo_casa < 0.5:
-            breakdown['pdi'] = 60 * SCORING_CONFIG["peso_pdi"]
+            breakdown['pdi'] = 60 * _PESO_PDI
             breakdown['pdi_desc'] = "Novato sem PDI - Falta de direcionamento"
         elif employee.tempo_casa < 1:
-            breakdown['pdi'] = 80 * SCORING_CONFIG["peso_pdi"]
+            breakdown['pdi'] = 80 * _PESO_PDI
             breakdown['pdi_desc'] = "Sem PDI há mais de 6 meses - Sinal de desengajamento"
         elif employee.tempo_casa < 3:
-            breakdown['pdi'] = 90 * SCORING_CONFIG["peso_pdi"]
+            breakdown['pdi'] = 90 * _PESO_PDI
             breakdown['pdi_desc'] = "Sem PDI há mais de 1 ano - Falta de desenvolvimento"
         else:
-            breakdown['pdi'] = 100 * SCORING_CONFIG["peso_pdi"]
+            breakdown['pdi'] = 100 * _PESO_PDI
             breakdown['pdi_desc'] = "Veterano sem PDI - CRÍTICO! Falta total de desenvolvimento"
     else:
         breakdown['pdi_desc'] = "Participou do PDI - Desenvolvimento ativo"
@@ -667,39 +913,39 @@ def calcular_breakdown_score(employee: Employee) -> dict:
     # Treinamentos
     if employee.tempo_casa >= 0.5:
         if employee.num_treinamentos == 0:
-            breakdown['treinamentos'] = 100 * SCORING_CONFIG["peso_treinamentos"]
+            breakdown['treinamentos'] = 100 * _PESO_TR
             breakdown['treinamentos_desc'] = "ZERO treinamentos - Falta total de capacitação"
         elif employee.num_treinamentos == 1:
-            breakdown['treinamentos'] = 80 * SCORING_CONFIG["peso_treinamentos"]
+            breakdown['treinamentos'] = 80 * _PESO_TR
             breakdown['treinamentos_desc'] = "Apenas 1 treinamento - Capacitação insuficiente"
         elif employee.num_treinamentos < 3:
-            breakdown['treinamentos'] = 60 * SCORING_CONFIG["peso_treinamentos"]
+            breakdown['treinamentos'] = 60 * _PESO_TR
             breakdown['treinamentos_desc'] = f"Poucos treinamentos ({employee.num_treinamentos}) - Abaixo do esperado"
         elif employee.num_treinamentos < 5:
-            breakdown['treinamentos'] = 30 * SCORING_CONFIG["peso_treinamentos"]
+            breakdown['treinamentos'] = 30 * _PESO_TR
             breakdown['treinamentos_desc'] = f"Treinamentos adequados ({employee.num_treinamentos})"
         else:
             breakdown['treinamentos_desc'] = f"Bem treinado ({employee.num_treinamentos} treinamentos)"
     else:
         if employee.num_treinamentos == 0:
-            breakdown['treinamentos'] = 70 * SCORING_CONFIG["peso_treinamentos"]
+            breakdown['treinamentos'] = 70 * _PESO_TR
             breakdown['treinamentos_desc'] = "Novato sem treinamentos - Necessita capacitação urgente"
     
     # Ausências
     if employee.num_ausencias <= 2:
-        breakdown['ausencias'] = 10 * SCORING_CONFIG["peso_ausencias"]
+        breakdown['ausencias'] = 10 * _PESO_AU
         breakdown['ausencias_desc'] = "Pontualidade excelente"
     elif employee.num_ausencias <= 5:
-        breakdown['ausencias'] = 40 * SCORING_CONFIG["peso_ausencias"]
+        breakdown['ausencias'] = 40 * _PESO_AU
         breakdown['ausencias_desc'] = "Ausências dentro do aceitável"
     elif employee.num_ausencias <= 10:
-        breakdown['ausencias'] = 70 * SCORING_CONFIG["peso_ausencias"]
+        breakdown['ausencias'] = 70 * _PESO_AU
         breakdown['ausencias_desc'] = "Ausências preocupantes - Investigar causas"
     elif employee.num_ausencias <= 20:
-        breakdown['ausencias'] = 90 * SCORING_CONFIG["peso_ausencias"]
+        breakdown['ausencias'] = 90 * _PESO_AU
         breakdown['ausencias_desc'] = "Ausências frequentes - Problema sério"
     else:
-        breakdown['ausencias'] = 100 * SCORING_CONFIG["peso_ausencias"]
+        breakdown['ausencias'] = 100 * _PESO_AU
         breakdown['ausencias_desc'] = "Ausências excessivas - CRÍTICO!"
         
         if employee.num_ausencias >= 50:
@@ -734,20 +980,37 @@ def calcular_breakdown_score(employee: Employee) -> dict:
     return breakdown
 
 def render_export():
-    if not st.session_state.employees:
+    if st.session_state.emp_df.empty:
         st.warning("⚠️ Carregue dados primeiro")
         return
     
     st.markdown("### 📋 Exportar Relatório")
     
-    if st.button("📥 Gerar Excel", use_container_width=True):
-        excel_data = export_to_excel(st.session_state.employees)
-        
+    emp_df = st.session_state.emp_df
+    st.dataframe(formatar_relatorio(emp_df), use_container_width=True, height=400)
+    
+    # Só o formato escolhido é gerado (e fica em cache); download em um clique
+    base_grande = len(emp_df) > EXCEL_MAX_LINHAS
+    formato = st.radio("Formato do arquivo", ["Excel", "Parquet"], index=1 if base_grande else 0, horizontal=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    
+    if formato == "Excel":
+        if base_grande:
+            st.warning(f"⚠️ Base com mais de {EXCEL_MAX_LINHAS} colaboradores: o Excel pode demorar. Prefira o Parquet.")
         st.download_button(
             label="💾 Download Excel",
-            data=excel_data,
-            file_name=f"relatorio_radar_rh_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            data=export_to_excel(emp_df),
+            file_name=f"relatorio_radar_rh_{timestamp}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True
+        )
+    else:
+        st.download_button(
+            label="📦 Download Parquet",
+            data=export_to_parquet(emp_df),
+            file_name=f"relatorio_radar_rh_{timestamp}.parquet",
+            mime="application/octet-stream",
+            use_container_width=True
         )
 
 # Teste do algoritmo